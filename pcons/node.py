@@ -3,7 +3,8 @@
 # Node base class for all nodes: filesystem (source and/or target), value, or custom
 
 import pathlib
-from typing import Union
+from itertools import chain
+from typing import Iterator, Union
 from enum import Enum
 
 
@@ -14,6 +15,8 @@ class NodeStatus(Enum):
 
 
 class Node:
+    __slots__ = ("explicit_deps", "implicit_deps")
+
     explicit_deps: list["Node"]
     implicit_deps: list["Node"]
 
@@ -22,9 +25,9 @@ class Node:
         self.explicit_deps = args.get("dependencies", [])
         self.implicit_deps = []
 
-    def deps(self):
-        """All direct dependencies of this node"""
-        return self.explicit_deps + self.implicit_deps
+    def deps(self) -> Iterator["Node"]:
+        """Iterate over all direct dependencies of this node"""
+        return chain(self.explicit_deps, self.implicit_deps)
 
     def depends(self, n: Union["Node", list["Node"]]) -> None:
         """Add one or more dependencies for this node, i.e. node(s) which must be up to date
@@ -43,11 +46,17 @@ class FSNode(Node):
     the filesystem at the time this is called, for example if the
     FSNode represents a target to be built."""
 
+    __slots__ = ("path",)
+
     path: pathlib.Path
 
     def __init__(self, path: pathlib.Path | str, **_args):
         super().__init__()
-        self.path = pathlib.Path(path)
+        # Paths are immutable, so reuse one we're given rather than copy it
+        if isinstance(path, pathlib.Path):
+            self.path = path
+        else:
+            self.path = pathlib.Path(path)
 
     def exists(self) -> bool:
         return self.path.exists()
@@ -56,6 +65,8 @@ class FSNode(Node):
 class FileNode(FSNode):
     """A file system File node, representing a possible file in the file system."""
 
+    __slots__ = ()
+
     def __init__(self, path: pathlib.Path | str, **_args):
         super().__init__(path)
 
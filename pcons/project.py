@@ -3,8 +3,8 @@
 # A Project represents a complete project including the build graph
 # and tools used to traverse the nodes
 
-import inspect
 import pathlib
+import sys
 from typing import Union
 from pathlib import Path
 from pcons.node import Node, FSNode
@@ -14,12 +14,18 @@ from pcons.generator import Generator
 class Project:
     generator: Generator
     name: str
-    defined_at: list[inspect.FrameInfo]  # save stack, for debugging
+    defined_at: tuple[str, int, str]  # caller file, line, func for debugging
     targets: list[Node]
 
     def __init__(self, name: str, generator: Generator):
         self.name = name
-        self.defined_at = inspect.stack()
+        # Only record the constructor's caller; inspect.stack() is slow
+        caller = sys._getframe(1)
+        self.defined_at = (
+            caller.f_code.co_filename,
+            caller.f_lineno,
+            caller.f_code.co_name,
+        )
         self.generator = generator
         self.targets = []
 
@@ -41,8 +47,8 @@ class Project:
         self.generator.generate(self, Path(path))
 
     def where(self):
-        defn = self.defined_at[1]  # constructor's caller
-        return f'"{defn.filename}":{defn.lineno} in {defn.function}()'
+        filename, lineno, function = self.defined_at
+        return f'"{filename}":{lineno} in {function}()'
 
     def __str__(self):
         return f'Project<"{self.name}" in {self.where()}>'
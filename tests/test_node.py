@@ -19,9 +19,8 @@ def test_depends():
     n1 = FSNode("/tmp/target")
     n2 = FSNode("/tmp/source")
     n1.depends(n2)
-    assert len(n1.deps()) > 0
-    assert len(n2.deps()) == 0
-    assert n1.deps()[0] == n2
+    assert list(n1.deps()) == [n2]
+    assert list(n2.deps()) == []
 
 
 def test_file(tmpdir):  # tmpdir test module objects are LocalPath
@@ -33,3 +32,14 @@ def test_file(tmpdir):  # tmpdir test module objects are LocalPath
     n2.depends(n1)
     assert n1.exists()
     assert not n2.exists()
+
+
+def test_fsnode_reuses_path():
+    p = pathlib.Path("/tmp/foo.bar")
+    n = FSNode(p)
+    assert n.path is p
+
+
+def test_nodes_have_no_instance_dict():
+    for n in (Node(), FSNode("/tmp/foo"), FileNode("/tmp/foo")):
+        assert not hasattr(n, "__dict__")
@@ -0,0 +1,9 @@
+from pcons.project import Project
+from pcons.generator import NinjaGenerator
+
+
+def test_where():
+    p = Project("Test Project", generator=NinjaGenerator())
+    assert p.where().startswith(f'"{__file__}":')
+    assert p.where().endswith("in test_where()")
+    assert str(p).startswith('Project<"Test Project" in ')